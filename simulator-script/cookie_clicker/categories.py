@@ -28,7 +28,7 @@ def neverclick(version=v2031, player_cps=0, player_delay=0):
 
   # Simulate a single cursor purchase.
   # These initial values match up exactly with DHA's spreadsheets.
-  game.num_buildings['Cursor'] = 1
+  game.set_building_count('Cursor', 1)
   game.total_cookies = 15
   game.time_elapsed = 1.2
 
@@ -98,6 +98,6 @@ def nevercore(version=v2048, player_cps=None, player_delay=None):
   game.target_cookies = 1000000
   game.player_cps = 0.0001
   game.player_delay = 0
-  game.num_buildings['Cursor'] = 1
+  game.set_building_count('Cursor', 1)
   game.hardcore_mode = True
   return game
\ No newline at end of file
@@ -1,3 +1,5 @@
+import functools
+import importlib
 import math
 
 million = 10**6
@@ -6,41 +8,175 @@ trillion = 10**12
 
 
 ### Essentially a tuple of name, requirements, purchase price, and effects.
+### 'building_ids' is the version's BUILDING_IDX, used to translate the
+### requirements' building names to (id, amount) pairs and the effects' keys
+### to (id, key, effect) triples (id None for 'mouse' and 'all') once, when
+### the version is imported.
 class Upgrade:
-  def __init__(self, name, req, price, effects):
+  __slots__ = ('name', 'req', 'price', 'effects', 'req_ids', 'effect_ids')
+  def __init__(self, name, req, price, effects, building_ids):
     self.name = name
     self.req = req
     self.price = price
     self.effects = effects
+    self.req_ids = tuple((building_ids[name], amount) for name, amount in req.items())
+    self.effect_ids = tuple((building_ids.get(key), key, effect) for key, effect in effects.items())
   def __hash__(self): return hash(self.name)
 
 
+### The kinds of effects. Each takes a single parameter 'x'.
+ADD = 0                     # r + x
+MUL = 1                     # r * x
+ADD_FRAC_BUILDING_RATE = 2  # r + x * (cookies per second of all buildings)
+ADD_FINGERS = 3             # r + x * (number of non-cursor buildings)
+MUL_GRANDMA = 4             # r * (1 + 1% per x buildings of type 'building')
+
+
 ### Effects need a priority to be applied in the right order.
 ### Higher priorities are applied first.  
 class Effect:
-  def __init__(self, priority, func):
+  __slots__ = ('priority', 'kind', 'param', 'building', 'constant')
+  def __init__(self, priority, kind, param, building=None):
     self.priority = priority
-    self.func = func
+    self.kind = kind
+    self.param = param
+    # Id of the building the effect counts, if it counts one.
+    self.building = building
+    # Constant effects don't depend on the game state, so Game can fold
+    # them into per-building coefficients.
+    self.constant = kind == ADD or kind == MUL
   def __lt__(self, other): return self.priority < other.priority
 
+  # Returns the rate 'r' with this effect applied, in 'game'.
+  def apply(self, r, game):
+    kind, x = self.kind, self.param
+    if kind == ADD: return r + x
+    if kind == MUL: return r * x
+    if kind == ADD_FRAC_BUILDING_RATE: return r + x * game.building_only_rate()
+    if kind == ADD_FINGERS: return r + x * game._non_cursor_count
+    if kind == MUL_GRANDMA:
+      return r * (1 + 0.01 * (game.num_buildings[self.building] // x))
+    return r
+
+
+### Returns the priority above which the constant effects among 'effects', all
+### on one building, can be folded as '(base + add) * mult'. Above it, no
+### effect depending on the game state is applied before them, and no gain is
+### applied after a multiplier. Equal priorities apply in purchase order, so a
+### priority with both is never folded.
+def fold_priority(effects):
+  seen_mul = False
+  for priority in sorted({effect.priority for effect in effects}, reverse=True):
+    kinds = {effect.kind for effect in effects if effect.priority == priority}
+    if not kinds <= {ADD, MUL}: return priority
+    if ADD in kinds and (seen_mul or MUL in kinds): return priority
+    seen_mul = seen_mul or MUL in kinds
+  return float('-inf')
+
+
+### Returns how long it takes to save up 'price' cookies, given the rate of
+### the buildings alone and the total rate with the player clicking.
+### This code is the most heavily commented because it is most suspected
+### of not working.
+def spend_time(price, building_rate, total_rate, player_delay):
+  # How long would it take to save up 'price' with just buildings?
+  if building_rate:
+    building_only_time = price / building_rate
+  else:
+    building_only_time = None
+
+  # This simulates the loss of cookies during a purchase when you
+  # have to take your mouse off the big cookie.
+  if building_only_time is None or building_only_time > player_delay:
+    # This is the case for when the player purchase delay is longer than
+    # time it would take to save up for the purchase with only buildings.
+    # Ergo, the mouse will provide some amount of clicks towards this
+    # purchase.
+    shared_mouse_price = price - player_delay * building_rate
+    # The amount of time during saving up for which the mouse and the
+    # buildings are both contributing
+    mouse_active_time = shared_mouse_price / total_rate
+    return mouse_active_time + player_delay
+  else:
+    # This is the case when the purchase is saved up for so quickly, that
+    # there's no point in even removing the mouse from the store to 
+    # slide it back over to the big cookie.
+    return building_only_time
+
+
+### Powers 'price_rate**k' for the first 'n' values of 'k'. Every building
+### type has the same price rate, so they all share one table.
+@functools.lru_cache(maxsize=None)
+def price_powers(price_rate, n=1001):
+  return tuple(price_rate**k for k in range(n))
+
+### Prices of the first 'n' buildings of a given base price, since raising to
+### a power on every price lookup is slow. Shared between all games.
+@functools.lru_cache(maxsize=None)
+def price_table(base_price, price_rate, n=1001):
+  return tuple(math.ceil(base_price * power) for power in price_powers(price_rate, n))
+
+
+### Writes a straight-line version of the sum over all buildings in
+### 'building_only_rate', for a given number of buildings. The number of
+### buildings is fixed per version, so this removes the loop overhead from
+### the hottest code in the simulation.
+@functools.lru_cache(maxsize=None)
+def unrolled_total_rate(n):
+  total = ' + '.join(f'rates[{i}] * counts[{i}]' for i in range(n))
+  namespace = {}
+  exec(f'def total_rate(rates, counts): return {total}\n', namespace)
+  return namespace['total_rate']
+
 
 ### This is the class that actually simulates Cookie Clicker.
 class Game:
 
   price_rate = 1.15
 
+  # Thousands of games are made per step of routing, so they have no
+  # per-instance dict.
+  __slots__ = (
+    '_version', '_upgrades', 'menu', '_idx', '_base_rates', '_base_prices',
+    '_price_tables', '_cursor', '_total_rate', '_upgrade_bits', '_fold_above',
+    '_unlocked_by', '_unlocked',
+    'num_buildings',
+    '_non_cursor_count', '_add', '_mult', '_rates', '_global_mult',
+    'building_effects',
+    'effects', '_rate_cache', '_mouse_cache',
+    'total_cookies', 'time_elapsed', 'player_cps', 'player_delay',
+    'target_cookies', 'hardcore_mode', 'history',
+  )
+
   def __init__(self, version, parent=None):
     if parent is None:
-      # Version data.
-      self.building_names = list(version.building_names)
-      self.base_prices = dict(version.base_prices)
-      self.base_rates = dict(version.base_rates)
-      self.menu = set(version.menu)
+      self._load_version(version)
+      # The menu is a bitmask of the upgrades still available to buy.
+      self.menu = (1 << len(self._upgrades)) - 1
       # Gameplay data.
-      self.num_buildings = {name:0 for name in self.building_names}
-      self.effects = {name:[] for name in self.building_names}
-      self.effects['mouse'] = []
-      self.effects['all'] = []
+      # Per-building data are immutable tuples so that children can share
+      # them; purchases replace the tuple rather than changing it.
+      self.num_buildings = (0,) * len(self.building_names)
+      self._non_cursor_count = 0
+      # Bitmask of the upgrades whose requirements are satisfied, kept up
+      # to date as buildings are bought.
+      self._unlocked = self._unlocked_mask()
+      self._add = (0,) * len(self.building_names)
+      self._mult = (1,) * len(self.building_names)
+      # Product of the multipliers on the total of all buildings (like
+      # kittens), applied before the rest of the 'all' effects.
+      self._global_mult = 1
+      # Rate of a single building of each type with only the constant
+      # effects, '(base + add) * mult'. Only changes when an upgrade does.
+      self._rates = tuple(self._base_rates)
+      # Building effects that depend on the game state, by building id.
+      # Each is kept in the order it's applied in, so it never needs sorting.
+      self.building_effects = ((),) * len(self.building_names)
+      # Other effects, like on clicking ('mouse') and on the total of all
+      # buildings ('all'). Only has the keys that have effects.
+      self.effects = {}
+      self._rate_cache = None
+      self._mouse_cache = None
       self.total_cookies = 0
       self.time_elapsed = 0
       self.player_cps = 0
@@ -48,17 +184,36 @@ class Game:
       # Speedrun data.
       self.target_cookies = 0
       self.hardcore_mode = False
-      self.history = []
+      # Purchases as a linked list of (last purchase, earlier history)
+      # pairs, so children can share it. See 'history_list'.
+      self.history = None
     else:
-      # Version data from 'parent'.
+      # Version data from 'parent'. It never changes, so it's shared.
       # (Disregards 'version' argument entirely.)
-      self.building_names = list(parent.building_names)
-      self.base_prices = dict(parent.base_prices)
-      self.base_rates = dict(parent.base_rates)
-      self.menu = set(parent.menu)
+      self._version = parent._version
+      self._idx = parent._idx
+      self._base_rates = parent._base_rates
+      self._base_prices = parent._base_prices
+      self._price_tables = parent._price_tables
+      self._cursor = parent._cursor
+      self._total_rate = parent._total_rate
+      self._upgrade_bits = parent._upgrade_bits
+      self._fold_above = parent._fold_above
+      self._unlocked_by = parent._unlocked_by
+      self._upgrades = parent._upgrades
       # Gameplay data.
-      self.num_buildings = dict(parent.num_buildings)
-      self.effects = {name:list(parent.effects[name]) for name in parent.effects}
+      self.menu = parent.menu
+      self.num_buildings = parent.num_buildings
+      self._non_cursor_count = parent._non_cursor_count
+      self._unlocked = parent._unlocked
+      self._add = parent._add
+      self._mult = parent._mult
+      self._global_mult = parent._global_mult
+      self._rates = parent._rates
+      self.building_effects = parent.building_effects
+      self.effects = parent.effects
+      self._rate_cache = parent._rate_cache
+      self._mouse_cache = parent._mouse_cache
       self.total_cookies = parent.total_cookies
       self.time_elapsed = parent.time_elapsed
       self.player_cps = parent.player_cps
@@ -66,14 +221,73 @@ class Game:
       # Speedrun data.
       self.target_cookies = parent.target_cookies
       self.hardcore_mode = parent.hardcore_mode
-      self.history = list(parent.history)
-
-  def spack(self, x): return str(x) if len(str(x)) == 1 else '(' + str(x) + ')'
+      self.history = parent.history
+
+  @property
+  def building_names(self): return self._version.building_names
+  @property
+  def base_prices(self): return self._version.base_prices
+  @property
+  def base_rates(self): return self._version.base_rates
+
+  # Sets up the data derived from 'version'. It never changes, so it's read
+  # from 'version' rather than copied (see the properties above), and
+  # shared with all children.
+  def _load_version(self, version):
+    self._version = version
+    # Upgrades are sorted by price, so the affordable ones come first.
+    self._upgrades = tuple(sorted(version.menu, key=lambda upgrade: upgrade.price))
+    # Buildings are stored by id, in the order of 'building_names'.
+    self._idx = version.BUILDING_IDX
+    self._base_rates = version.BASE_RATES
+    self._base_prices = version.BASE_PRICES
+    self._price_tables = [price_table(p, self.price_rate) for p in self._base_prices]
+    self._cursor = self._idx.get('Cursor')
+    self._total_rate = unrolled_total_rate(len(self.building_names))
+    # Each upgrade's bit in the menu bitmask. Kept here rather than on the
+    # upgrades, as other versions' games may sort them differently.
+    self._upgrade_bits = {upgrade: 1 << i for i, upgrade in enumerate(self._upgrades)}
+    # Constant effects on each building are only folded into its
+    # coefficients above this priority. See '_gain_upgrade'.
+    effects = tuple([] for _ in self.building_names)
+    for upgrade in self._upgrades:
+      for i, key, effect in upgrade.effect_ids:
+        if i is not None: effects[i].append(effect)
+    self._fold_above = tuple(fold_priority(e) for e in effects)
+    # For each building id, the (requirements, bit) of the upgrades
+    # requiring some amount of it, by that amount. See '_add_buildings'.
+    self._unlocked_by = tuple({} for _ in self.building_names)
+    for upgrade, bit in self._upgrade_bits.items():
+      for i, amount in upgrade.req_ids:
+        self._unlocked_by[i].setdefault(amount, []).append((upgrade.req_ids, bit))
+
+  # Building counts, with parentheses around those with multiple digits.
   def __str__(self): 
-    data = [self.num_buildings[name] for name in self.building_names]
-    return ''.join(self.spack(x) for x in data)
+    return ''.join(str(x) if x < 10 else f'({x})' for x in self.num_buildings)
   def __repr__(self): return str(self)
 
+  # Pickle the history as a flat list, as the linked list can be nested too
+  # deeply for pickle to recurse through. The data derived from the version
+  # is large and the same for every game, so only the version's module name
+  # is pickled and the rest is rebuilt from it.
+  _version_data = (
+    '_version', '_upgrades', '_idx', '_base_rates', '_base_prices',
+    '_price_tables', '_cursor', '_total_rate', '_upgrade_bits', '_fold_above',
+    '_unlocked_by',
+  )
+  def __getstate__(self):
+    state = {name: getattr(self, name) for name in self.__slots__
+             if name not in self._version_data}
+    state['history'] = self.history_list()
+    state['version'] = self._version.__name__
+    return state
+  def __setstate__(self, state):
+    purchases = state.pop('history')
+    self._load_version(importlib.import_module(state.pop('version')))
+    for name, value in state.items(): setattr(self, name, value)
+    self.history = None
+    for purchase in purchases: self.history = (purchase, self.history)
+
 
 
   ### Router required methods
@@ -83,9 +297,9 @@ class Game:
 
   # Prints an informative blurb about the current game state.
   def speak(self):
-    last_purchase = self.history[-1]
+    last_purchase = self.history[0]
     if last_purchase in self.building_names:
-      last_purchase += ' [' + str(self.num_buildings[last_purchase]) + ']'
+      last_purchase += ' [' + str(self.building_count(last_purchase)) + ']'
 
     # The list of information we want displayed.
     data = [
@@ -98,68 +312,147 @@ class Game:
     # And just throw it all in one line.
     print('  '.join(str(x) for x in data))
 
+  # Returns the list of all purchases made, in order.
+  def history_list(self):
+    purchases = []
+    h = self.history
+    while h:
+      purchases.append(h[0])
+      h = h[1]
+    return purchases[::-1]
+
   # This is just so the router doesn't have to use the word "cookies".
   def currency_produced(self): return self.total_cookies
 
   # Iterate over possible successive game states.
   def children(self): 
-    for name in self.building_names:
-      child = Game(version=None, parent=self)
-      if not child.purchase_building(name): continue
+    # Every building purchase starts from this game's rates, so work out
+    # each one's price and time here and only clone the affordable ones.
+    building_rate = self.building_only_rate()
+    rate = building_rate + self.mouse_rate()
+    for i, name in enumerate(self.building_names):
+      price = self._building_price(i)
+      if self.total_cookies + price > self.target_cookies: continue
+      child = self._paid_child(price, building_rate, rate)
+      child._gain_building(i)
       yield child
-    for upgrade in self.menu:
-      child = Game(version=None, parent=self)
-      if not child.purchase_upgrade(upgrade): continue
+    # Same for upgrades, only looking at the unlocked ones. They're sorted
+    # by price, so none after the first one too expensive is affordable.
+    if self.hardcore_mode: return
+    menu = self.menu & self._unlocked
+    while menu:
+      bit = menu & -menu
+      menu ^= bit
+      upgrade = self._upgrades[bit.bit_length() - 1]
+      price = upgrade.price
+      if self.total_cookies + price > self.target_cookies: break
+      child = self._paid_child(price, building_rate, rate)
+      child._gain_upgrade(upgrade, bit)
       yield child
 
+  # Returns a copy of this game that has spent 'price' cookies, given
+  # this game's building and total rates.
+  def _paid_child(self, price, building_rate, rate):
+    child = Game(version=None, parent=self)
+    child.total_cookies += price
+    child.time_elapsed += spend_time(price, building_rate, rate, self.player_delay)
+    return child
+
   # Returns the final time of this game if played out with no further purchases.
+  # Only reads the game's totals and its cached building and per-click
+  # rates, so it's cheap to call.
   def completion_time(self):
     if self.total_cookies >= self.target_cookies: 
       return self.time_elapsed
-    if not self.rate(): return None
+    rate = self.rate()
+    if not rate: return None
     remaining_cookies = self.target_cookies - self.total_cookies
-    return self.time_elapsed + remaining_cookies / self.rate()
+    return self.time_elapsed + remaining_cookies / rate
 
 
 
   ### Query methods.
 
+  # Returns the number of buildings of a given type owned.
+  def building_count(self, building_name):
+    return self.num_buildings[self._idx[building_name]]
+
   # Returns the cookies per second of single building of a given type.
   def building_rate(self, building_name):
-    r = self.base_rates[building_name]
-    building_effects = sorted(self.effects[building_name], reverse=True)
-    for effect in building_effects: r = effect.func(r, self)
-    return r
+    i = self._idx[building_name]
+    r = self._rates[i]
+    return self.apply_effects(r, self.building_effects[i])
 
   # Returns the cookies per second produced by all buildings.
+  # Cached until the next purchase.
   def building_only_rate(self):
-    r = 0
+    if self._rate_cache is not None: return self._rate_cache
+
+    # Constant effects are already folded into '_rates'. Only the effects
+    # that depend on the game state still need applying.
+    rates = self._rates
+    for i, effects in enumerate(self.building_effects):
+      if effects:
+        if rates is self._rates: rates = list(rates)
+        rates[i] = self.apply_effects(rates[i], effects)
 
     # Add up each building's rate.
-    for name in self.building_names:
-      r += self.building_rate(name) * self.num_buildings[name]
+    r = self._total_rate(rates, self.num_buildings)
 
     # Then apply any global effects (like kittens).
-    for effect in self.effects['all']: r = effect.func(r, self)
-    
+    r *= self._global_mult
+    r = self.apply_effects(r, self.effects.get('all', ()))
+
+    self._rate_cache = r
     return r
 
   # Returns the cookies per second made by the players clicking.
+  # The per-click part is cached until the next purchase.
   def mouse_rate(self):
-    r = 1.0
-    for effect in self.effects['mouse']: r = effect.func(r, self)
+    r = self._mouse_cache
+    if r is None:
+      r = self.apply_effects(1.0, self.effects.get('mouse', ()))
+      self._mouse_cache = r
     return r * self.player_cps
 
+  # Applies some effects, in order, to the rate 'r'.
+  def apply_effects(self, r, effects):
+    for effect in effects:
+      # The constant kinds are the most common, so they skip the call.
+      kind = effect.kind
+      if kind == MUL: r *= effect.param
+      elif kind == ADD: r += effect.param
+      else: r = effect.apply(r, self)
+    return r
+
   # Returns the current price of a single building of a given type
   def building_price(self, building_name):
-    num_building = self.num_buildings[building_name]
-    base_price = self.base_prices[building_name]
-    return math.ceil(base_price * self.price_rate**num_building)
+    return self._building_price(self._idx[building_name])
+
+  def _building_price(self, i):
+    num_building = self.num_buildings[i]
+    if num_building < len(self._price_tables[i]):
+      return self._price_tables[i][num_building]
+    return math.ceil(self._base_prices[i] * self.price_rate**num_building)
+
+  # Bitmask of the upgrades bought. See 'has_upgrade'.
+  @property
+  def upgrades_owned(self): return ~self.menu & ((1 << len(self._upgrades)) - 1)
+
+  # Checks if this game has bought a given upgrade from its version's menu.
+  def has_upgrade(self, upgrade): return not self.menu & self._upgrade_bits[upgrade]
 
   # Checks if this game owns certain amounts of some buildings.
   def has_satisfied(self, req):
     for building_name, amount in req.items():
-      if self.num_buildings[building_name] < amount: return False
+      if self.building_count(building_name) < amount: return False
+    return True
+
+  # Same as 'has_satisfied', for (building id, amount) pairs.
+  def has_satisfied_ids(self, req_ids):
+    counts = self.num_buildings
+    for i, amount in req_ids:
+      if counts[i] < amount: return False
     return True
 
 
@@ -167,54 +460,103 @@ class Game:
   ### Gameplay methods.
 
   # Spends a given amount of cookies. Also updates time and other such.
-  # This code is the most heavily commented because it is most suspected
-  # of not working.
   def spend(self, price):
     # Make sure we don't overshoot our target.
     if self.total_cookies + price > self.target_cookies: return False
     self.total_cookies += price
-
-    # How long would it take to save up 'price' with just buildings?
-    if self.building_only_rate():
-      building_only_time = price / self.building_only_rate()
-    else:
-      building_only_time = None
-
-    # This simulates the loss of cookies during a purchase when you
-    # have to take your mouse off the big cookie.
-    if building_only_time is None or building_only_time > self.player_delay:
-      # This is the case for when the player purchase delay is longer than
-      # time it would take to save up for the purchase with only buildings.
-      # Ergo, the mouse will provide some amount of clicks towards this
-      # purchase.
-      shared_mouse_price = price - self.player_delay * self.building_only_rate()
-      # The amount of time during saving up for which the mouse and the
-      # buildings are both contributing
-      mouse_active_time = shared_mouse_price / self.rate()
-      self.time_elapsed += mouse_active_time + self.player_delay
-    else:
-      # This is the case when the purchase is saved up for so quickly, that
-      # there's no point in even removing the mouse from the store to 
-      # slide it back over to the big cookie.
-      self.time_elapsed += building_only_time
-    
+    building_rate = self.building_only_rate()
+    rate = building_rate + self.mouse_rate()
+    self.time_elapsed += spend_time(price, building_rate, rate, self.player_delay)
     return True
 
   # Purchase a single building of a given type. True if successful.
   def purchase_building(self, building_name):
-    price = self.building_price(building_name)
-    if not self.spend(price): return False
-    self.num_buildings[building_name] += 1
-    self.history.append(building_name)
+    return self.step_building(self._idx[building_name])
+
+  # Same as 'purchase_building', for the building with id 'i'.
+  def step_building(self, i):
+    if not self.spend(self._building_price(i)): return False
+    self._gain_building(i)
     return True
 
+  # Adds a single already paid for building with id 'i'.
+  def _gain_building(self, i):
+    self._add_buildings(i, 1)
+    # Mouse effects may depend on buildings too (e.g. fingers upgrades).
+    self._rate_cache = self._mouse_cache = None
+    self.history = (self.building_names[i], self.history)
+
+  # Adds 'amount' to the number of buildings with id 'i'.
+  def _add_buildings(self, i, amount):
+    t = self.num_buildings
+    self.num_buildings = t[:i] + (t[i] + amount,) + t[i+1:]
+    # Fingers upgrades need this on every rate evaluation.
+    if i != self._cursor: self._non_cursor_count += amount
+    # Unlock the upgrades whose requirements the new buildings completed.
+    if amount > 0:
+      unlocked_by = self._unlocked_by[i]
+      for n in range(t[i] + 1, t[i] + amount + 1):
+        for req_ids, bit in unlocked_by.get(n, ()):
+          if self.has_satisfied_ids(req_ids): self._unlocked |= bit
+    elif amount < 0:
+      self._unlocked = self._unlocked_mask()
+
+  # Returns the bitmask of the upgrades whose requirements are satisfied.
+  def _unlocked_mask(self):
+    mask = 0
+    for upgrade, bit in self._upgrade_bits.items():
+      if self.has_satisfied_ids(upgrade.req_ids): mask |= bit
+    return mask
+
+  # Sets the number of buildings of a given type owned, free of charge.
+  # Used to set up the starting state of some speedrun categories.
+  def set_building_count(self, building_name, amount):
+    i = self._idx[building_name]
+    self._add_buildings(i, amount - self.num_buildings[i])
+    self._rate_cache = self._mouse_cache = None
+
   # Purchase a given upgrade. True if successful.
   def purchase_upgrade(self, upgrade):
     if self.hardcore_mode: return False
-    if not self.has_satisfied(upgrade.req): return False
+    bit = self._upgrade_bits.get(upgrade)
+    if bit is None or not self.menu & self._unlocked & bit: return False
     if not self.spend(upgrade.price): return False
-    for building_name, effect in upgrade.effects.items():
-      self.effects[building_name].append(effect)
-    self.history.append(upgrade.name)
-    self.menu.remove(upgrade)
-    return True
\ No newline at end of file
+    self._gain_upgrade(upgrade, bit)
+    return True
+
+  # Adds the effects of an already paid for upgrade, given its menu bit.
+  def _gain_upgrade(self, upgrade, bit):
+    for i, key, effect in upgrade.effect_ids:
+      # Constant building effects go straight into the coefficients when
+      # that keeps the order effects are applied in: above '_fold_above',
+      # gains come before multipliers, which commute.
+      if effect.constant and i is not None and effect.priority > self._fold_above[i]:
+        if effect.kind == ADD:
+          a = self._add
+          self._add = a[:i] + (a[i] + effect.param,) + a[i+1:]
+        else:
+          m = self._mult
+          self._mult = m[:i] + (m[i] * effect.param,) + m[i+1:]
+        r = self._rates
+        self._rates = r[:i] + ((self._base_rates[i] + self._add[i]) * self._mult[i],) + r[i+1:]
+      elif i is not None:
+        # Building effects are kept in the order they're applied in: by
+        # descending priority, then in purchase order.
+        effects = self.building_effects[i]
+        j = 0
+        while j < len(effects) and effects[j].priority >= effect.priority: j += 1
+        effects = effects[:j] + (effect,) + effects[j:]
+        t = self.building_effects
+        self.building_effects = t[:i] + (effects,) + t[i+1:]
+      elif key == 'all' and effect.kind == MUL and 'all' not in self.effects:
+        # Multipliers on the total commute, so they're folded into one as
+        # long as no other kind of effect on the total came before them.
+        self._global_mult *= effect.param
+      else:
+        # Copy-on-write, as the dict may be shared with other games.
+        self.effects = dict(self.effects)
+        self.effects[key] = self.effects.get(key, ()) + (effect,)
+    # Mouse effects may depend on the building rate (e.g. mouse upgrades).
+    self._rate_cache = self._mouse_cache = None
+    self.history = (upgrade.name, self.history)
+    self.menu &= ~bit
\ No newline at end of file
@@ -8,4 +8,4 @@ game_over = r.route_GPL(g, lookahead=1)
 
 final_time = game_over.completion_time()
 print('Final time: ' + str(final_time / 60 / 60)) # Print in hours.
-print(game_over.num_buildings)
\ No newline at end of file
+print(dict(zip(game_over.building_names, game_over.num_buildings)))
\ No newline at end of file
@@ -1,17 +1,25 @@
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+
 class Router:
 
-  # Brute-forces the optimal playthrough of 'game' with depth-first-search.
-  def route_DFS(self, game):
-    return game
-  
+  # 'descendant_budget' caps the descendants scored per child when looking
+  # ahead, as their number grows exponentially with the lookahead.
+  def __init__(self, descendant_budget=10000):
+    self.descendant_budget = descendant_budget
+
   # Finds a decent playthrough of 'game' by minimizing payoff load locally.
-  def route_GPL(self, game, lookahead=1):
+  # Prints each move if 'verbose'.
+  def route_GPL(self, game, lookahead=1, verbose=True):
     num_moves = 0
     while True:
       child = self.GPL_child(game, generation=lookahead)
       if child is None: break
       game = child
       num_moves += 1
+      if not verbose: continue
       game.speak()
       if num_moves % 10 == 0: print(' ')
     return game
@@ -20,22 +28,17 @@ class Router:
   # (an easy heuristic giving locally optimal routing in simple cases)
   def GPL_child(self, game, generation=1):
     game_rate = game.rate() # Calculate this once to save computer power.
+    # Without lookahead each child is its own only descendant, so all the
+    # children are scored at once.
+    if generation == 1:
+      children = list(game.children())
+      best, _ = best_payoff_load(game, children, game_rate)
+      return None if best is None else children[best]
     best_child = best_pl = None
     for child in game.children():
-      best_descendant_pl = None
-      for descendant in self.descendants(child, generation-1):
-        # What changed from 'game' to this descendant?
-        time_change = descendant.time_elapsed - game.time_elapsed
-        rate_change = descendant.rate() - game_rate
-        # Make sure the CpS actually went up.
-        if rate_change == 0: continue
-        # Payoff load calculation.
-        price = game_rate * time_change
-        #price = child.currency_produced() - game.currency_produced()
-        payoff_load = price * (1 + game_rate / rate_change)
-        # Record the best descendant of this 'child'.
-        if best_descendant_pl is None or payoff_load < best_descendant_pl:
-          best_descendant_pl = payoff_load
+      # Record the best descendant of this 'child'.
+      descendants = self.descendants(child, generation-1, self.descendant_budget)
+      _, best_descendant_pl = best_payoff_load(game, descendants, game_rate)
       # If there were no descendants just move on to the next child.
       if best_descendant_pl is None: continue
       # Record the child with the best descendant.
@@ -46,13 +49,80 @@ class Router:
 
   # Macro for Game's "children" method.
   # Yields all descendants of a game object of a given generation.
-  # Recursive.
-  def descendants(self, game, generation=1):
+  # Depth-first, with a stack of (children left to visit, their generation)
+  # rather than recursion.
+  # Stops after 'budget' descendants, if given.
+  def descendants(self, game, generation=1, budget=None):
+    if budget is not None:
+      yield from itertools.islice(self.descendants(game, generation), budget)
+      return
     # Generation 0 just means return the game that was passed in.
     if generation == 0:
       yield game
       return
-    # Recursive call. Call "descendants" on game's children.
-    for child in game.children():
-      for descendant in self.descendants(child, generation-1):
-        yield descendant
\ No newline at end of file
+    stack = [(game.children(), generation-1)]
+    while stack:
+      children, generation = stack[-1]
+      if generation == 0:
+        yield from children
+        stack.pop()
+        continue
+      child = next(children, None)
+      if child is None: stack.pop()
+      else: stack.append((child.children(), generation-1))
+
+
+# Returns the index of the descendant of 'game' with the lowest payoff load,
+# and that payoff load. 'game_rate' is 'game.rate()'. (None, None) if no
+# descendant has a higher CpS than 'game'.
+def best_payoff_load(game, descendants, game_rate):
+  best = best_pl = None
+  time = game.time_elapsed
+  for i, descendant in enumerate(descendants):
+    # What changed from 'game' to this descendant?
+    time_change = descendant.time_elapsed - time
+    rate_change = descendant.rate() - game_rate
+    # Make sure the CpS actually went up.
+    if rate_change == 0: continue
+    # Payoff load calculation.
+    price = game_rate * time_change
+    #price = child.currency_produced() - game.currency_produced()
+    payoff_load = price + price * game_rate / rate_change
+    if best_pl is None or payoff_load < best_pl:
+      best = i
+      best_pl = payoff_load
+  return best, best_pl
+
+# Runs 'rollout_fn' on each child of 'game' in parallel processes and
+# returns the (result, child) with the lowest result, ignoring None results.
+# Returns None if there are none. 'rollout_fn' must be module level to
+# pickle. Pass an executor as 'pool' to reuse it across calls; otherwise one
+# is started for this call.
+def evaluate_children_parallel(game, rollout_fn, pool=None, workers=None):
+  children = list(game.children())
+  if pool is None:
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+      results = list(pool.map(rollout_fn, children))
+  else:
+    results = list(pool.map(rollout_fn, children))
+  best = None
+  for result, child in zip(results, children):
+    if result is None: continue
+    if best is None or result < best[0]: best = (result, child)
+  return best
+
+# Routes a single speedrun category (a function from categories.py).
+# This is module level so that worker processes can call it.
+def route_category(category, lookahead=1):
+  # Quiet, as the workers' prints would interleave. The purchases are
+  # returned instead.
+  game = Router().route_GPL(category(), lookahead=lookahead, verbose=False)
+  return game.completion_time(), category.__name__, game.history_list()
+
+# Routes several speedrun categories in parallel, one process each.
+# Returns (completion time, category name, purchases) sorted by time.
+def run_all(categories, lookahead=1, workers=None):
+  categories = list(categories)
+  with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+    results = pool.map(route_category, categories, [lookahead] * len(categories))
+    return sorted(results, key=lambda result: (result[0] is None, result[0] or 0))
\ No newline at end of file